@@ -3,13 +3,15 @@ Habit model and business logic.
 Handles habit creation, tracking, and statistics calculation.
 """
 
+from bisect import bisect_left, insort
+import re
 from datetime import datetime, date
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field, asdict
-import uuid
+from typing import List, Dict, Any, Optional, Pattern, Set
+from dataclasses import dataclass, field
+import secrets
 
 
-@dataclass
+@dataclass(slots=True)
 class Habit:
     """Represents a single habit with tracking data."""
     
@@ -17,7 +19,58 @@ class Habit:
     description: str = ""
     created_date: str = field(default_factory=lambda: date.today().isoformat())
     completion_dates: List[str] = field(default_factory=list)
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    # Ids only need to be unique within the local data file; existing
+    # uuid4 ids from older files load unchanged.
+    id: str = field(default_factory=lambda: secrets.token_hex(8))
+    
+    # Derived indexes, built in __post_init__ and never serialized
+    _completion_set: Set[str] = field(init=False, repr=False, compare=False)
+    _ordinals: Set[int] = field(init=False, repr=False, compare=False)
+    _longest_cache: Optional[int] = field(init=False, repr=False, compare=False)
+    _created_ordinal: int = field(init=False, repr=False, compare=False)
+    _bits_base: int = field(init=False, repr=False, compare=False)
+    _bits: int = field(init=False, repr=False, compare=False)
+    _stats_cache: Optional[tuple] = field(init=False, repr=False, compare=False)
+    version: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Build the indexes used by completion lookups and streak math."""
+        self._completion_set = set(self.completion_dates)
+        # ISO dates sort chronologically as strings; keep the list ordered
+        self.completion_dates = sorted(self._completion_set)
+        self._ordinals = {date.fromisoformat(d).toordinal() for d in self._completion_set}
+        self._longest_cache = None
+        self._created_ordinal = date.fromisoformat(self.created_date).toordinal()
+        # Bumped on every mutation so serializers can reuse unchanged output
+        self.version = 0
+        self._stats_cache = None
+        
+        # Bit k of _bits is set iff day (_bits_base + k) is completed
+        self._bits_base = min(self._ordinals, default=self._created_ordinal)
+        self._bits_base = min(self._bits_base, self._created_ordinal)
+        self._bits = 0
+        for ordinal in self._ordinals:
+            self._bits |= 1 << (ordinal - self._bits_base)
+    
+    def _set_bit(self, ordinal: int):
+        """Set the completion bit for a day, rebasing for earlier dates."""
+        if ordinal < self._bits_base:
+            self._bits <<= self._bits_base - ordinal
+            self._bits_base = ordinal
+        self._bits |= 1 << (ordinal - self._bits_base)
+    
+    def _clear_bit(self, ordinal: int):
+        """Clear the completion bit for a day."""
+        self._bits &= ~(1 << (ordinal - self._bits_base))
+    
+    def _run_ending_at(self, index: int) -> int:
+        """Count consecutive set bits from `index` downwards."""
+        if index < 0:
+            return 0
+        gaps = ~self._bits & ((1 << (index + 1)) - 1)
+        if not gaps:
+            return index + 1
+        return index - (gaps.bit_length() - 1)
     
     def mark_completed(self, completion_date: Optional[date] = None):
         """
@@ -30,9 +83,14 @@ class Habit:
             completion_date = date.today()
         
         date_str = completion_date.isoformat()
-        if date_str not in self.completion_dates:
-            self.completion_dates.append(date_str)
-            self.completion_dates.sort()
+        if date_str not in self._completion_set:
+            self._completion_set.add(date_str)
+            self._ordinals.add(completion_date.toordinal())
+            self._set_bit(completion_date.toordinal())
+            insort(self.completion_dates, date_str)
+            self._longest_cache = None
+            self._stats_cache = None
+            self.version += 1
     
     def unmark_completed(self, completion_date: Optional[date] = None):
         """
@@ -45,12 +103,39 @@ class Habit:
             completion_date = date.today()
         
         date_str = completion_date.isoformat()
-        if date_str in self.completion_dates:
-            self.completion_dates.remove(date_str)
+        if date_str in self._completion_set:
+            self._completion_set.discard(date_str)
+            self._ordinals.discard(completion_date.toordinal())
+            self._clear_bit(completion_date.toordinal())
+            del self.completion_dates[bisect_left(self.completion_dates, date_str)]
+            self._longest_cache = None
+            self._stats_cache = None
+            self.version += 1
     
-    def is_completed_today(self) -> bool:
-        """Check if habit is completed for today."""
-        return date.today().isoformat() in self.completion_dates
+    def update(self, name: Optional[str] = None, description: Optional[str] = None):
+        """
+        Update habit name and/or description.
+        
+        Args:
+            name: New name (optional)
+            description: New description (optional)
+        """
+        if name is not None:
+            self.name = name
+        if description is not None:
+            self.description = description
+        self.version += 1
+    
+    def is_completed_today(self, today: Optional[date] = None) -> bool:
+        """
+        Check if habit is completed for today.
+        
+        Args:
+            today: Current date, if already known by the caller
+        """
+        if today is None:
+            today = date.today()
+        return today.toordinal() in self._ordinals
     
     def is_completed_on_date(self, check_date: date) -> bool:
         """
@@ -62,41 +147,27 @@ class Habit:
         Returns:
             True if completed on that date
         """
-        return check_date.isoformat() in self.completion_dates
+        return check_date.toordinal() in self._ordinals
     
-    def get_current_streak(self) -> int:
+    def get_current_streak(self, today: Optional[date] = None) -> int:
         """
         Calculate current streak of consecutive completions.
         
+        Args:
+            today: Current date, if already known by the caller
+        
         Returns:
             Number of consecutive days (including today if completed)
         """
-        if not self.completion_dates:
-            return 0
+        if today is None:
+            today = date.today()
         
-        streak = 0
-        current_date = date.today()
-        
-        # Check if today is completed or if yesterday was (to allow for current streak)
-        if not self.is_completed_on_date(current_date):
-            # If not completed today, check yesterday
-            from datetime import timedelta
-            yesterday = current_date - timedelta(days=1)
-            if not self.is_completed_on_date(yesterday):
-                return 0
-            streak = 1
-            current_date = yesterday
-        else:
-            streak = 1
-        
-        # Count backwards from current date
-        from datetime import timedelta
-        while True:
-            current_date = current_date - timedelta(days=1)
-            if self.is_completed_on_date(current_date):
-                streak += 1
-            else:
-                break
+        index = today.toordinal() - self._bits_base
+        streak = self._run_ending_at(index)
+        
+        # Allow the streak to end yesterday if today isn't completed yet
+        if streak == 0:
+            streak = self._run_ending_at(index - 1)
         
         return streak
     
@@ -107,46 +178,100 @@ class Habit:
         Returns:
             Maximum number of consecutive days
         """
-        if not self.completion_dates:
-            return 0
+        if self._longest_cache is not None:
+            return self._longest_cache
         
-        max_streak = 1
-        current_streak = 1
+        # Each AND with a shifted copy shortens every run of ones by one bit,
+        # so the number of rounds until zero is the longest run
+        bits = self._bits
+        max_streak = 0
+        while bits:
+            bits &= bits >> 1
+            max_streak += 1
         
-        sorted_dates = sorted([date.fromisoformat(d) for d in self.completion_dates])
+        self._longest_cache = max_streak
+        return max_streak
+    
+    def get_recent_completions(self, days: int = 7, today: Optional[date] = None) -> List[bool]:
+        """
+        Get completion flags for the last few days.
         
-        for i in range(1, len(sorted_dates)):
-            from datetime import timedelta
-            if sorted_dates[i] - sorted_dates[i-1] == timedelta(days=1):
-                current_streak += 1
-                max_streak = max(max_streak, current_streak)
-            else:
-                current_streak = 1
+        Args:
+            days: Number of days to include, ending today
+            today: Current date, if already known by the caller
+            
+        Returns:
+            One flag per day, oldest first
+        """
+        if today is None:
+            today = date.today()
         
-        return max_streak
+        # Slice the window out of the bitmap instead of probing each day
+        start = today.toordinal() - (days - 1) - self._bits_base
+        window = self._bits >> start if start >= 0 else self._bits << -start
+        return [bool(window >> k & 1) for k in range(days)]
+    
+    def get_stats(self, today: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Get all derived statistics, cached until completions or the date change.
+        
+        Args:
+            today: Current date, if already known by the caller
+            
+        Returns:
+            Dictionary with streak, longest, total, rate, today and last7
+        """
+        if today is None:
+            today = date.today()
+        
+        cached = self._stats_cache
+        if cached is not None and cached[0] == today:
+            return cached[1]
+        
+        stats = {
+            "streak": self.get_current_streak(today),
+            "longest": self.get_longest_streak(),
+            "total": self.get_total_completions(),
+            "rate": self.get_completion_rate(today),
+            "today": self.is_completed_today(today),
+            "last7": self.get_recent_completions(7, today),
+        }
+        self._stats_cache = (today, stats)
+        return stats
     
     def get_total_completions(self) -> int:
         """Get total number of completions."""
         return len(self.completion_dates)
     
-    def get_completion_rate(self) -> float:
+    def get_completion_rate(self, today: Optional[date] = None) -> float:
         """
         Calculate completion rate since habit creation.
         
+        Args:
+            today: Current date, if already known by the caller
+        
         Returns:
             Percentage of days completed (0-100)
         """
-        created = date.fromisoformat(self.created_date)
-        days_since_creation = (date.today() - created).days + 1
+        if today is None:
+            today = date.today()
+        
+        days_since_creation = today.toordinal() - self._created_ordinal + 1
         
         if days_since_creation == 0:
             return 0.0
         
-        return (self.get_total_completions() / days_since_creation) * 100
+        return (len(self._ordinals) / days_since_creation) * 100
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert habit to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            "name": self.name,
+            "description": self.description,
+            "created_date": self.created_date,
+            "completion_dates": list(self.completion_dates),
+            "id": self.id,
+        }
     
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'Habit':
@@ -162,12 +287,85 @@ class Habit:
         return Habit(**data)
 
 
+class NameIndex:
+    """Suffix trie over lowercased habit names for substring search."""
+    
+    def __init__(self):
+        """Initialize an empty index."""
+        # Each node is [children by character, {habit_id: count}]
+        self._root: list = [{}, {}]
+        self._names: Dict[str, str] = {}
+    
+    def add(self, habit_id: str, name: str):
+        """
+        Index every suffix of a habit's name.
+        
+        Args:
+            habit_id: ID of the habit
+            name: Habit name
+        """
+        self.remove(habit_id)
+        key = name.lower()
+        self._names[habit_id] = key
+        for start in range(len(key)):
+            node = self._root
+            for char in key[start:]:
+                node = node[0].setdefault(char, [{}, {}])
+                node[1][habit_id] = node[1].get(habit_id, 0) + 1
+    
+    def remove(self, habit_id: str):
+        """
+        Drop a habit from the index, pruning nodes that become empty.
+        
+        Args:
+            habit_id: ID of the habit
+        """
+        key = self._names.pop(habit_id, None)
+        if key is None:
+            return
+        for start in range(len(key)):
+            node = self._root
+            for char in key[start:]:
+                child = node[0][char]
+                count = child[1][habit_id] - 1
+                if count:
+                    child[1][habit_id] = count
+                else:
+                    del child[1][habit_id]
+                if not child[1]:
+                    del node[0][char]
+                    break
+                node = child
+    
+    def search(self, query: str) -> Set[str]:
+        """
+        Find habits whose name contains the query, ignoring case.
+        
+        Args:
+            query: Text to look for
+            
+        Returns:
+            Set of matching habit IDs
+        """
+        if not query:
+            return set(self._names)
+        node = self._root
+        for char in query.lower():
+            node = node[0].get(char)
+            if node is None:
+                return set()
+        return set(node[1])
+
+
 class HabitManager:
     """Manages collection of habits and provides operations."""
     
     def __init__(self):
         """Initialize habit manager."""
         self.habits: List[Habit] = []
+        self._by_id: Dict[str, Habit] = {}
+        self._name_index = NameIndex()
+        self._compiled_query: Optional[tuple] = None
     
     def add_habit(self, name: str, description: str = "") -> Habit:
         """
@@ -182,6 +380,8 @@ class HabitManager:
         """
         habit = Habit(name=name, description=description)
         self.habits.append(habit)
+        self._by_id[habit.id] = habit
+        self._name_index.add(habit.id, habit.name)
         return habit
     
     def remove_habit(self, habit_id: str) -> bool:
@@ -194,11 +394,12 @@ class HabitManager:
         Returns:
             True if removed successfully
         """
-        for i, habit in enumerate(self.habits):
-            if habit.id == habit_id:
-                self.habits.pop(i)
-                return True
-        return False
+        habit = self._by_id.pop(habit_id, None)
+        if habit is None:
+            return False
+        self.habits.remove(habit)
+        self._name_index.remove(habit_id)
+        return True
     
     def get_habit(self, habit_id: str) -> Optional[Habit]:
         """
@@ -210,10 +411,7 @@ class HabitManager:
         Returns:
             Habit instance or None
         """
-        for habit in self.habits:
-            if habit.id == habit_id:
-                return habit
-        return None
+        return self._by_id.get(habit_id)
     
     def update_habit(self, habit_id: str, name: Optional[str] = None, 
                     description: Optional[str] = None) -> bool:
@@ -230,10 +428,9 @@ class HabitManager:
         """
         habit = self.get_habit(habit_id)
         if habit:
+            habit.update(name, description)
             if name is not None:
-                habit.name = name
-            if description is not None:
-                habit.description = description
+                self._name_index.add(habit.id, habit.name)
             return True
         return False
     
@@ -241,14 +438,50 @@ class HabitManager:
         """Get all habits."""
         return self.habits
     
+    def search_habits(self, query: str) -> List[Habit]:
+        """
+        Find habits whose name contains the query, ignoring case.
+        
+        A query with several words matches names containing all of them
+        in that order, e.g. "read book" matches "Read a book".
+        
+        Args:
+            query: Text to look for
+            
+        Returns:
+            Matching habits in list order
+        """
+        terms = query.split()
+        if len(terms) > 1:
+            # Narrow to names containing every term, then check the order
+            matches = set.intersection(*(self._name_index.search(t) for t in terms))
+            pattern = self._compile_terms(terms)
+            return [habit for habit in self.habits
+                    if habit.id in matches and pattern.search(habit.name)]
+        
+        matches = self._name_index.search(query)
+        return [habit for habit in self.habits if habit.id in matches]
+    
+    def _compile_terms(self, terms: List[str]) -> Pattern[str]:
+        """Compile (and cache) a pattern matching the terms in order."""
+        key = tuple(terms)
+        if self._compiled_query is None or self._compiled_query[0] != key:
+            pattern = re.compile('.*'.join(map(re.escape, terms)), re.IGNORECASE)
+            self._compiled_query = (key, pattern)
+        return self._compiled_query[1]
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert all habits to dictionary for JSON serialization."""
         return {
             "habits": [habit.to_dict() for habit in self.habits],
-            "metadata": {
-                "last_updated": datetime.now().isoformat(),
-                "total_habits": len(self.habits)
-            }
+            "metadata": self.get_metadata()
+        }
+    
+    def get_metadata(self) -> Dict[str, Any]:
+        """Build the metadata block stored alongside the habits."""
+        return {
+            "last_updated": datetime.now().isoformat(),
+            "total_habits": len(self.habits)
         }
     
     def from_dict(self, data: Dict[str, Any]):
@@ -259,6 +492,11 @@ class HabitManager:
             data: Dictionary with habits data
         """
         self.habits = []
+        self._by_id = {}
+        self._name_index = NameIndex()
         if "habits" in data:
             for habit_data in data["habits"]:
-                self.habits.append(Habit.from_dict(habit_data))
+                habit = Habit.from_dict(habit_data)
+                self.habits.append(habit)
+                self._by_id[habit.id] = habit
+                self._name_index.add(habit.id, habit.name)
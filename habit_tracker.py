@@ -6,20 +6,58 @@ This file provides a single, stable implementation that imports `habit_model` an
 and provides a `ModernHabitTrackerApp` class with a `main()` entrypoint.
 """
 
+import argparse
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
-from datetime import date, timedelta
-from typing import Optional
+from contextlib import contextmanager, nullcontext
+from datetime import date
+from typing import Dict, Optional
 
 from habit_model import HabitManager
-from storage import HabitStorage
+from storage import HabitStorage, SyncMode
 
 
 # Appearance Configuration
 ctk.set_appearance_mode('System')  # 'System', 'Dark', 'Light'
 ctk.set_default_color_theme('blue')  # 'blue', 'green', 'dark-blue'
 
+# Shared button color schemes
+_BTN_PRIMARY = dict(fg_color='#1E90FF', hover_color='#1565C0')
+_BTN_SUCCESS = dict(fg_color='#10B981', hover_color='#0F9A60')
+_BTN_NEUTRAL = dict(fg_color='#6B7280', hover_color='#4B5563')
+_BTN_DANGER = dict(fg_color='#EF4444', hover_color='#DC2626')
+
+# Check-in button options for each state shown in the details panel
+_CHECKIN_STATES = {
+    'disabled': dict(state='disabled'),
+    'todo': dict(state='normal', text='✓ Check In', fg_color='#10B981'),
+    'done': dict(state='normal', text='✕ Undo Check-in', fg_color='#FF7B7B'),
+}
+
+# Pack options of the scrollable habit list in the sidebar
+_HABIT_SCROLL_PACK = dict(fill='both', expand=True, padx=8)
+
+# Sidebar rows are created in pages of this size; each CTk row costs
+# several canvas-drawn widgets, so long lists are not built all at once
+_ROW_PAGE = 50
+
+# Sidebar row button colors, keyed by whether the row is selected
+_ROW_COLORS = {
+    False: dict(fg_color='transparent', hover_color='#2D2F31'),
+    True: dict(fg_color='#374151', hover_color='#2f3a44'),
+}
+
+# Sentinel for widget options that have not been set through _set() yet
+_UNSET = object()
+
+# Status icons indexed by a completed flag (False -> 0, True -> 1)
+_LIST_ICONS = ('⬜', '✅')
+_HIST_ICONS = ('⬜', '🟩')
+
+# Weekday labels for the history row, indexed by date.weekday()
+_WEEKDAY_ABBR = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
 
 class ModernHabitTrackerApp:
     """Modern habit tracker using customtkinter for a contemporary UI."""
@@ -31,14 +69,30 @@ class ModernHabitTrackerApp:
         self.root.minsize(900, 600)
 
         # Data managers
-        self.storage = HabitStorage()
+        # Saves go to storage's background writer; group their fsyncs per second
+        self.storage = HabitStorage(sync_mode=SyncMode.EVERY_SEC)
         self.habit_manager = HabitManager()
         self._load_data()
 
         # State
         self.selected_habit_id: Optional[str] = None
+        self._row_widgets: Dict[str, tuple] = {}
+        self._list_signature: Optional[tuple] = None
+        self._today: Optional[date] = None
+        self._rendered: Dict[object, dict] = {}
+        self._last_history_key: Optional[tuple] = None
+        self._dirty = False
+        self._save_after_id: Optional[str] = None
+        self._checkin_state: Optional[str] = None
+        self._search_after_id: Optional[str] = None
+        self._row_limit = _ROW_PAGE
+        self._more_shown = False
+        self._repaint_scheduled = False
+        self._input_dialog: Optional[ctk.CTkToplevel] = None
+        self._input_callback = None
 
         # Layout
+        self._create_fonts()
         self._create_layout()
         self._refresh_habit_list()
         self._update_details()
@@ -46,6 +100,14 @@ class ModernHabitTrackerApp:
         # Close handling
         self.root.protocol('WM_DELETE_WINDOW', self._on_closing)
 
+    def _create_fonts(self):
+        """Create shared font objects once; CTkFont needs an existing root."""
+        self.font_title = ctk.CTkFont(family='Segoe UI', size=20, weight='bold')
+        self.font_heading = ctk.CTkFont(family='Segoe UI', size=18, weight='bold')
+        self.font_body = ctk.CTkFont(family='Segoe UI', size=12)
+        self.font_small = ctk.CTkFont(family='Segoe UI', size=10)
+        self.font_mono = ctk.CTkFont(family='Consolas', size=12)
+
     def _create_layout(self):
         """Create the main application layout."""
         # Header
@@ -53,8 +115,7 @@ class ModernHabitTrackerApp:
         header.pack(side='top', fill='x')
         header.grid_propagate(False)
 
-        title = ctk.CTkLabel(header, text='🎯 Habit Tracker',
-                             font=('Segoe UI', 20, 'bold'))
+        title = ctk.CTkLabel(header, text='🎯 Habit Tracker', font=self.font_title)
         title.pack(side='left', padx=20)
 
         # Main container
@@ -68,19 +129,22 @@ class ModernHabitTrackerApp:
         sidebar.grid(row=0, column=0, sticky='nswe', padx=(0, 12), pady=4)
         sidebar.grid_propagate(False)
 
-        add_btn = ctk.CTkButton(sidebar, text='+ New Habit', fg_color='#1E90FF',
-                                hover_color='#1565C0', corner_radius=8, command=self._add_habit_dialog)
+        add_btn = ctk.CTkButton(sidebar, text='+ New Habit', corner_radius=8,
+                                command=self._add_habit_dialog, **_BTN_PRIMARY)
         add_btn.pack(fill='x', padx=12, pady=(12, 8))
 
         self.search_var = ctk.StringVar()
         search_entry = ctk.CTkEntry(
             sidebar, placeholder_text='Search habits...', textvariable=self.search_var, width=220)
         search_entry.pack(fill='x', padx=12, pady=(0, 12))
-        search_entry.bind('<KeyRelease>', lambda e: self._refresh_habit_list())
+        search_entry.bind('<KeyRelease>', self._on_search_key)
 
         self.habit_scroll = ctk.CTkScrollableFrame(
             sidebar, width=260, height=520, corner_radius=6)
-        self.habit_scroll.pack(fill='both', expand=True, padx=8)
+        self.habit_scroll.pack(**_HABIT_SCROLL_PACK)
+        self.show_more_btn = ctk.CTkButton(
+            self.habit_scroll, text='Show more', command=self._show_more_rows,
+            **_BTN_NEUTRAL)
 
         # Content
         content = ctk.CTkFrame(main, corner_radius=8)
@@ -88,28 +152,28 @@ class ModernHabitTrackerApp:
         content.grid_rowconfigure(2, weight=1)
 
         self.detail_title = ctk.CTkLabel(
-            content, text='Select a habit to view details', font=('Segoe UI', 18, 'bold'))
+            content, text='Select a habit to view details', font=self.font_heading)
         self.detail_title.grid(
             row=0, column=0, sticky='w', padx=20, pady=(20, 6))
 
-        self.detail_desc = ctk.CTkLabel(content, text='', font=(
-            'Segoe UI', 12), text_color='#7C8BA4', wraplength=520)
+        self.detail_desc = ctk.CTkLabel(content, text='', font=self.font_body,
+                                        text_color='#7C8BA4', wraplength=520)
         self.detail_desc.grid(row=1, column=0, sticky='w', padx=20)
 
         action_frame = ctk.CTkFrame(content, fg_color='transparent')
         action_frame.grid(row=0, column=1, rowspan=2,
                           sticky='e', padx=20, pady=6)
 
-        self.checkin_btn = ctk.CTkButton(action_frame, text='✓ Check In', fg_color='#10B981',
-                                         hover_color='#0F9A60', command=self._toggle_today_completion)
+        self.checkin_btn = ctk.CTkButton(action_frame, text='✓ Check In',
+                                         command=self._toggle_today_completion, **_BTN_SUCCESS)
         self.checkin_btn.pack(side='right', padx=6)
 
-        edit_btn = ctk.CTkButton(action_frame, text='Edit', fg_color='#6B7280',
-                                 hover_color='#4B5563', command=self._edit_habit_dialog)
+        edit_btn = ctk.CTkButton(action_frame, text='Edit',
+                                 command=self._edit_habit_dialog, **_BTN_NEUTRAL)
         edit_btn.pack(side='right', padx=6)
 
-        delete_btn = ctk.CTkButton(action_frame, text='Delete', fg_color='#EF4444',
-                                   hover_color='#DC2626', command=self._delete_habit)
+        delete_btn = ctk.CTkButton(action_frame, text='Delete',
+                                   command=self._delete_habit, **_BTN_DANGER)
         delete_btn.pack(side='right', padx=6)
 
         # Stats
@@ -132,62 +196,184 @@ class ModernHabitTrackerApp:
         self.history_frame.grid(
             row=3, column=0, columnspan=2, sticky='nwe', padx=20, pady=(0, 20))
         self.history_label = ctk.CTkLabel(
-            self.history_frame, text='', font=('Consolas', 12))
+            self.history_frame, text='', font=self.font_mono)
         self.history_label.pack(fill='x')
 
     def _create_stat_card(self, parent, title, value, col):
         """Create a styled statistic card."""
         card = ctk.CTkFrame(parent, corner_radius=8, fg_color='transparent')
         card.grid(row=0, column=col, padx=6, sticky='nwe')
-        ctk.CTkLabel(card, text=title, font=('Segoe UI', 10), text_color='#98A1B3').pack(
+        ctk.CTkLabel(card, text=title, font=self.font_small, text_color='#98A1B3').pack(
             anchor='w', padx=12, pady=(10, 0))
-        lbl = ctk.CTkLabel(card, text=value, font=('Segoe UI', 18, 'bold'))
+        lbl = ctk.CTkLabel(card, text=value, font=self.font_heading)
         lbl.pack(anchor='w', padx=12, pady=(6, 12))
         return lbl
 
     def _refresh_habit_list(self):
-        """Refresh the sidebar habit list."""
-        for w in self.habit_scroll.winfo_children():
-            w.destroy()
-
+        """Refresh the sidebar habit list, reusing existing row widgets."""
         query = self.search_var.get().strip().lower() if getattr(
             self, 'search_var', None) else ''
-        for habit in self.habit_manager.get_all_habits():
-            if query and query not in habit.name.lower():
-                continue
+        today = self._current_date()
+
+        # Bind loop-invariant lookups to locals once
+        rows = self._row_widgets
+        selected_id = self.selected_habit_id
+        configure_row = self._configure_habit_row
+
+        # Nothing to do if the filter, selection, day and habits are unchanged
+        habits = self.habit_manager.get_all_habits()
+        signature = (query, selected_id, today, self._row_limit,
+                     tuple((h.id, h.version) for h in habits))
+        if signature == self._list_signature:
+            return
+        self._list_signature = signature
+
+        visible = self.habit_manager.search_habits(query) if query else habits
+        hidden = len(visible) - self._row_limit
+        if hidden > 0:
+            visible = visible[:self._row_limit]
+        visible_ids = [h.id for h in visible]
+
+        # Only rows being created or destroyed change the layout; hide the
+        # list for those so Tk lays it out once rather than once per row
+        wanted = set(visible_ids)
+        stale = [i for i in rows if i not in wanted]
+        relayout = (bool(stale) or any(i not in rows for i in visible_ids)
+                    or (hidden > 0) != self._more_shown)
+        batch = (self._batch_ui(self.habit_scroll, **_HABIT_SCROLL_PACK)
+                 if relayout else nullcontext())
+        with batch:
+            if relayout:
+                # Taken out so appended rows land above it; re-packed below
+                self.show_more_btn.pack_forget()
+
+            # Drop rows for habits that were deleted or filtered out
+            for habit_id in stale:
+                row = rows.pop(habit_id)
+                row[0].destroy()
+                for widget in row[1:]:
+                    self._rendered.pop(widget, None)
+
+            # Walk backwards so each new row can be packed before its successor
+            next_frame = None
+            for habit in reversed(visible):
+                row = rows.get(habit.id)
+                if row is None:
+                    row = rows[habit.id] = self._create_habit_row(habit, before=next_frame)
+                configure_row(row, habit, today, habit.id == selected_id)
+                next_frame = row[0]
+
+            if relayout and hidden > 0:
+                self.show_more_btn.pack(fill='x', pady=6, padx=6)
+            self._more_shown = hidden > 0
+            if hidden > 0:
+                self._set(self.show_more_btn, text=f'Show {min(hidden, _ROW_PAGE)} more')
+
+    @contextmanager
+    def _batch_ui(self, widget, **pack_kwargs):
+        """Unmap a packed widget during bulk updates and re-pack it afterwards."""
+        widget.pack_forget()
+        try:
+            yield
+        finally:
+            widget.pack(**pack_kwargs)
+            widget.update_idletasks()
+
+    def _show_more_rows(self):
+        """Extend the sidebar by another page of habits."""
+        self._row_limit += _ROW_PAGE
+        self._refresh_habit_list()
 
-            item_frame = ctk.CTkFrame(
-                self.habit_scroll, corner_radius=8, fg_color='transparent')
-            item_frame.pack(fill='x', pady=6, padx=6)
+    def _on_search_key(self, event=None):
+        """Refresh the list once typing in the search box pauses."""
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(150, self._run_search)
 
-            b = ctk.CTkButton(item_frame, text=f"{habit.name}", anchor='w', fg_color='transparent',
-                              hover_color='#2D2F31', command=lambda id=habit.id: self._select_habit(id))
-            b.pack(side='left', fill='x', expand=True)
+    def _run_search(self):
+        """Apply the current search query to the sidebar."""
+        self._search_after_id = None
+        self._row_limit = _ROW_PAGE
+        self._refresh_habit_list()
 
-            status = '✅' if habit.is_completed_today() else '⬜'
-            ctk.CTkLabel(item_frame, text=f"{status} {habit.get_current_streak()} 🔥", width=80, anchor='e').pack(
-                side='right')
+    def _create_habit_row(self, habit, before=None) -> tuple:
+        """Create the sidebar widgets for a habit, packed ahead of `before` if given."""
+        item_frame = ctk.CTkFrame(
+            self.habit_scroll, corner_radius=8, fg_color='transparent')
+        if before is not None:
+            item_frame.pack(fill='x', pady=6, padx=6, before=before)
+        else:
+            item_frame.pack(fill='x', pady=6, padx=6)
 
-            if self.selected_habit_id == habit.id:
-                b.configure(fg_color='#374151', hover_color='#2f3a44')
+        b = ctk.CTkButton(item_frame, text=habit.name, anchor='w', **_ROW_COLORS[False])
+        b.habit_id = habit.id
+        b.bind('<ButtonRelease-1>', self._on_row_click)
+        b.pack(side='left', fill='x', expand=True)
+
+        status_lbl = ctk.CTkLabel(item_frame, text='', width=80, anchor='e')
+        status_lbl.pack(side='right')
+        return item_frame, b, status_lbl
+
+    def _on_row_click(self, event):
+        """Select the habit whose sidebar row was clicked."""
+        # Clicks land on the button's inner canvas or label; walk up to the button
+        widget = event.widget
+        while widget is not None and not hasattr(widget, 'habit_id'):
+            widget = widget.master
+        if widget is not None:
+            self._select_habit(widget.habit_id)
+
+    def _configure_habit_row(self, row: tuple, habit, today: date, selected: bool):
+        """Bring a sidebar row's text and highlight up to date."""
+        _, button, status_lbl = row
+        stats = habit.get_stats(today)
+        status = _LIST_ICONS[stats['today']]
+        status_text = f"{status} {stats['streak']} 🔥"
+
+        self._set(button, text=habit.name, **_ROW_COLORS[selected])
+        self._set(status_lbl, text=status_text)
+
+    def _update_habit_row(self, habit):
+        """Update a single sidebar row in place after its habit changed."""
+        row = self._row_widgets.get(habit.id)
+        if row is None:
+            self._refresh_habit_list()
+            return
+        self._configure_habit_row(row, habit, self._current_date(),
+                                  habit.id == self.selected_habit_id)
 
     def _select_habit(self, habit_id: str):
         """Select a habit and update the details panel."""
         self.selected_habit_id = habit_id
+        self._schedule_repaint()
+
+    def _schedule_repaint(self):
+        """Refresh the sidebar and details panel once the current event is done.
+
+        Several changes in one event loop tick then cost a single repaint.
+        """
+        if not self._repaint_scheduled:
+            self._repaint_scheduled = True
+            self.root.after_idle(self._repaint)
+
+    def _repaint(self):
+        """Bring the sidebar and details panel up to date."""
+        self._repaint_scheduled = False
         self._refresh_habit_list()
         self._update_details()
 
     def _update_details(self):
         """Update the details panel with selected habit information."""
         if not self.selected_habit_id:
-            self.detail_title.configure(text='Select a habit to view details')
-            self.detail_desc.configure(text='')
-            self.card_streak.configure(text='0')
-            self.card_best.configure(text='0')
-            self.card_total.configure(text='0')
-            self.card_rate.configure(text='0%')
-            self.history_label.configure(text='')
-            self.checkin_btn.configure(state='disabled')
+            self._set(self.detail_title, text='Select a habit to view details')
+            self._set(self.detail_desc, text='')
+            self._set(self.card_streak, text='0')
+            self._set(self.card_best, text='0')
+            self._set(self.card_total, text='0')
+            self._set(self.card_rate, text='0%')
+            self._set(self.history_label, text='')
+            self._last_history_key = None
+            self._set_checkin_state('disabled')
             return
 
         h = self.habit_manager.get_habit(self.selected_habit_id)
@@ -195,29 +381,53 @@ class ModernHabitTrackerApp:
             self.selected_habit_id = None
             return
 
-        self.detail_title.configure(text=h.name)
-        self.detail_desc.configure(
-            text=h.description if h.description else '\u00A0')
-        self.card_streak.configure(text=str(h.get_current_streak()))
-        self.card_best.configure(text=str(h.get_longest_streak()))
-        self.card_total.configure(text=str(h.get_total_completions()))
-        self.card_rate.configure(text=f"{h.get_completion_rate():.0f}%")
-        self.checkin_btn.configure(state='normal')
-        if h.is_completed_today():
-            self.checkin_btn.configure(
-                text='✕ Undo Check-in', fg_color='#FF7B7B')
-        else:
-            self.checkin_btn.configure(text='✓ Check In', fg_color='#10B981')
-
-        days = []
-        today = date.today()
-        for i in range(6, -1, -1):
-            d = today - timedelta(days=i)
-            day_name = d.strftime('%a')
-            status = '🟩' if h.is_completed_on_date(d) else '⬜'
-            days.append(f"{day_name}: {status}")
-
-        self.history_label.configure(text='   '.join(days))
+        today = self._current_date()
+        stats = h.get_stats(today)
+        self._set(self.detail_title, text=h.name)
+        self._set(self.detail_desc, text=h.description if h.description else '\u00A0')
+        self._set(self.card_streak, text=str(stats['streak']))
+        self._set(self.card_best, text=str(stats['longest']))
+        self._set(self.card_total, text=str(stats['total']))
+        self._set(self.card_rate, text=f"{stats['rate']:.0f}%")
+        self._set_checkin_state('done' if stats['today'] else 'todo')
+
+        # Only rebuild the history row when the day or its flags changed
+        history_key = (h.id, today, tuple(stats['last7']))
+        if history_key != self._last_history_key:
+            weekday = today.weekday()
+            days = [f"{_WEEKDAY_ABBR[(weekday - 6 + i) % 7]}: {_HIST_ICONS[done]}"
+                    for i, done in enumerate(stats['last7'])]
+            self._set(self.history_label, text='   '.join(days))
+            self._last_history_key = history_key
+
+    def _set(self, widget, **options):
+        """Configure only the widget options that differ from what was last set.
+
+        Tk redraws on every configure() call, even when a value is unchanged.
+        """
+        rendered = self._rendered.setdefault(widget, {})
+        changed = {k: v for k, v in options.items() if rendered.get(k, _UNSET) != v}
+        if changed:
+            widget.configure(**changed)
+            rendered.update(changed)
+
+    def _current_date(self) -> date:
+        """Return today's date, computed at most once per event-loop tick."""
+        if self._today is None:
+            self._today = date.today()
+            self.root.after_idle(self._clear_current_date)
+        return self._today
+
+    def _clear_current_date(self):
+        """Forget the cached date once the current batch of callbacks is done."""
+        self._today = None
+
+    def _set_checkin_state(self, state: str):
+        """Reconfigure the check-in button only when its state changes."""
+        if state == self._checkin_state:
+            return
+        self.checkin_btn.configure(**_CHECKIN_STATES[state])
+        self._checkin_state = state
 
     def _add_habit_dialog(self):
         """Show dialog to add a new habit."""
@@ -234,48 +444,78 @@ class ModernHabitTrackerApp:
                                 default_name=h.name, default_desc=h.description)
 
     def _show_input_dialog(self, title, callback, default_name='', default_desc=''):
-        """Show a custom input dialog for habit creation/editing."""
+        """Show a custom input dialog for habit creation/editing.
+
+        The dialog is built on first use and then hidden and re-shown, since
+        constructing CTk widgets is far slower than reconfiguring them.
+        """
+        if self._input_dialog is None:
+            self._build_input_dialog()
+        d = self._input_dialog
+        self._input_callback = callback
+        self._input_name_var.set(default_name)
+        self._input_desc_var.set(default_desc)
+        d.title(title)
+        d.deiconify()
+        d.grab_set()
+        self._input_name_entry.focus()
+
+    def _build_input_dialog(self):
+        """Create the hidden input dialog reused by Add and Edit."""
         d = ctk.CTkToplevel(self.root)
         d.geometry('420x260')
-        d.title(title)
         d.transient(self.root)
-        d.grab_set()
+        d.protocol('WM_DELETE_WINDOW', self._hide_input_dialog)
 
         frame = ctk.CTkFrame(d)
         frame.pack(fill='both', expand=True, padx=16, pady=16)
 
         ctk.CTkLabel(frame, text='Name').pack(anchor='w')
-        name_var = ctk.StringVar(value=default_name)
-        name_entry = ctk.CTkEntry(
-            frame, textvariable=name_var, placeholder_text='e.g. Read 10 pages')
-        name_entry.pack(fill='x', pady=(6, 12))
+        self._input_name_var = ctk.StringVar()
+        self._input_name_entry = ctk.CTkEntry(
+            frame, textvariable=self._input_name_var,
+            placeholder_text='e.g. Read 10 pages')
+        self._input_name_entry.pack(fill='x', pady=(6, 12))
 
         ctk.CTkLabel(frame, text='Description').pack(anchor='w')
-        desc_var = ctk.StringVar(value=default_desc)
+        self._input_desc_var = ctk.StringVar()
         desc_entry = ctk.CTkEntry(
-            frame, textvariable=desc_var, placeholder_text='Optional short description')
+            frame, textvariable=self._input_desc_var,
+            placeholder_text='Optional short description')
         desc_entry.pack(fill='x', pady=(6, 12))
 
-        def on_save(event=None):
-            if name_var.get().strip():
-                callback(name_var.get(), desc_var.get())
-                d.destroy()
-                return
-            messagebox.showwarning('Validation', 'Name cannot be empty')
-
-        name_entry.focus()
-        d.bind('<Return>', on_save)
+        d.bind('<Return>', self._on_input_save)
 
         button_row = ctk.CTkFrame(frame, fg_color='transparent')
         button_row.pack(fill='x', pady=(6, 0))
-        ctk.CTkButton(button_row, text='Cancel', command=d.destroy,
+        ctk.CTkButton(button_row, text='Cancel', command=self._hide_input_dialog,
                       fg_color='transparent').pack(side='right', padx=6)
-        ctk.CTkButton(button_row, text='Save', command=on_save,
-                      fg_color='#1E90FF').pack(side='right')
+        ctk.CTkButton(button_row, text='Save', command=self._on_input_save,
+                      fg_color=_BTN_PRIMARY['fg_color']).pack(side='right')
+        self._input_dialog = d
+
+    def _on_input_save(self, event=None):
+        """Validate the dialog fields and hand them to the current callback."""
+        name = self._input_name_var.get()
+        if not name.strip():
+            messagebox.showwarning('Validation', 'Name cannot be empty')
+            return
+        callback = self._input_callback
+        self._hide_input_dialog()
+        if callback:
+            callback(name, self._input_desc_var.get())
+
+    def _hide_input_dialog(self):
+        """Hide the input dialog so it can be shown again later."""
+        self._input_callback = None
+        self._input_dialog.grab_release()
+        self._input_dialog.withdraw()
 
     def _save_new_habit(self, name, desc):
         """Save a new habit."""
         self.habit_manager.add_habit(name, desc)
+        # New habits go at the end of the list; page far enough to show it
+        self._row_limit = max(self._row_limit, len(self.habit_manager.habits))
         self._save_and_refresh()
 
     def _save_edit_habit(self, name, desc):
@@ -304,17 +544,44 @@ class ModernHabitTrackerApp:
         h = self.habit_manager.get_habit(self.selected_habit_id)
         if not h:
             return
-        if h.is_completed_today():
-            h.unmark_completed()
+        today = self._current_date()
+        if h.is_completed_today(today):
+            h.unmark_completed(today)
+            op = 'uncomplete'
         else:
-            h.mark_completed()
-        self._save_and_refresh()
+            h.mark_completed(today)
+            op = 'complete'
+        # Log just this change instead of rewriting the whole file; a full
+        # save folds the log back in once it grows
+        self.storage.append_delta({'op': op, 'habit_id': h.id, 'date': today.isoformat()})
+        if self.storage.needs_compaction():
+            self._save_data()
+        # Only this habit's row changed, so skip rebuilding the whole sidebar
+        self._update_habit_row(h)
+        self._update_details()
+
+    def _save_data(self):
+        """Mark data as changed and (re)schedule a coalesced write to storage."""
+        self._dirty = True
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(500, self._flush)
+
+    def _flush(self):
+        """Encode pending changes and hand them to the background writer."""
+        self._save_after_id = None
+        if not self._dirty:
+            return
+        # Encode on the UI thread so the writer never touches live habits
+        payload = self.storage.encode_habits(self.habit_manager.get_all_habits(),
+                                             self.habit_manager.get_metadata())
+        self._dirty = False
+        self.storage.save_encoded_async(payload)
 
     def _save_and_refresh(self):
         """Save data and refresh the UI."""
-        self.storage.save_data(self.habit_manager.to_dict())
-        self._refresh_habit_list()
-        self._update_details()
+        self._save_data()
+        self._schedule_repaint()
 
     def _load_data(self):
         """Load habit data from storage."""
@@ -323,12 +590,26 @@ class ModernHabitTrackerApp:
 
     def _on_closing(self):
         """Handle window close event."""
-        self.storage.save_data(self.habit_manager.to_dict())
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        # Queue the final state, then wait for the writer to put it on disk
+        self.storage.save_encoded_async(self.storage.encode_habits(
+            self.habit_manager.get_all_habits(), self.habit_manager.get_metadata()))
+        self.storage.close()
         self.root.destroy()
 
 
 def main():
     """Main entry point for the application."""
+    parser = argparse.ArgumentParser(description='Habit Tracker')
+    parser.add_argument('--export', metavar='PATH',
+                        help='write an indented copy of the habit data to PATH and exit')
+    args = parser.parse_args()
+    if args.export:
+        HabitStorage().export_pretty(args.export)
+        return
+
     root = ctk.CTk()
     # Attempt to improve DPI awareness on Windows
     try:
@@ -3,13 +3,169 @@ Storage module for handling JSON file operations.
 Manages reading from and writing to habits.json.
 """
 
+import atexit
+import enum
+import hashlib
 import json
+import mmap
 import os
 import shutil
 import sys
-from typing import Dict, Any
+import tempfile
+import threading
+from json.encoder import encode_basestring
+from typing import Dict, Any, Iterable, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# First bytes of a zstd frame; lets load_data tell compressed files from JSON
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Linux ioctl that makes one file share another's data blocks (Btrfs, XFS)
+_FICLONE = 0x40049409
+
+# Data files at least this large are parsed from a memory map (orjson only)
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _dumps(data: Dict[str, Any], pretty: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON, using orjson when available.
+
+    Output is compact unless `pretty` is set, in which case it is indented
+    by two spaces for human readers.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Parse UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class SyncMode(enum.Enum):
+    """When HabitStorage forces saved data onto the disk with fsync."""
+    PER_COMMIT = 'per_commit'  # write and fully sync (drive cache, directory) on every save
+    EVERY_SEC = 'every_sec'    # buffer saves; write and fsync at most once a second
+    NEVER = 'never'            # write on every save, leave flushing to the OS
+
+
+def _fsync(fd: int, full: bool = False):
+    """Flush a file to disk.
+
+    Plain fsync on macOS stops at the drive's volatile cache; with `full`
+    set, F_FULLFSYNC is used there so the data survives power loss.
+    """
+    if full and fcntl is not None and hasattr(fcntl, 'F_FULLFSYNC'):
+        try:
+            fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+            return
+        except OSError:
+            pass  # Not supported by this filesystem
+    os.fsync(fd)
+
+
+def _fsync_dir(directory: str):
+    """Flush a directory so a rename into it is durable (POSIX only)."""
+    if os.name != 'posix':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _decompress(raw) -> bytes:
+    """Inflate a zstd-compressed data file."""
+    if zstandard is None:
+        # Refuse rather than fall back to defaults and overwrite the user's data
+        raise RuntimeError("habits.json is zstd-compressed; install 'zstandard' to read it")
+    return zstandard.ZstdDecompressor().decompress(raw)
+
+
+def _digest(payload: bytes) -> bytes:
+    """Return a short fingerprint used to detect unchanged payloads."""
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _default_data() -> Dict[str, Any]:
+    """Return the document used when there is no usable data file."""
+    return {"habits": [], "metadata": {"created": datetime.now().isoformat()}}
+
+
+def _encode_habit(habit: Any) -> bytes:
+    """Encode one habit exactly as _dumps(habit.to_dict()) would, only faster.
+
+    The habit layout is fixed, so the keys are written as literals and only
+    the free-text fields need escaping. Dates were validated by
+    date.fromisoformat on load and are joined as-is. Keep in step with
+    Habit.to_dict().
+    """
+    dates = habit.completion_dates
+    return ''.join((
+        '{"name":', encode_basestring(habit.name),
+        ',"description":', encode_basestring(habit.description),
+        ',"created_date":"', habit.created_date,
+        '","completion_dates":[', '"' + '","'.join(dates) + '"' if dates else '',
+        '],"id":', encode_basestring(habit.id), '}',
+    )).encode('utf-8')
+
+
+def _apply_delta(habits_by_id: Dict[str, Dict[str, Any]], event: Dict[str, Any]):
+    """Apply one change-log event to habit dictionaries keyed by id.
+
+    Events are idempotent, so replaying one already folded into the
+    snapshot is harmless.
+    """
+    habit = habits_by_id.get(event.get('habit_id'))
+    if habit is None:
+        return
+    dates = habit.setdefault('completion_dates', [])
+    day = event.get('date')
+    if event.get('op') == 'complete':
+        if day not in dates:
+            dates.append(day)
+    elif event.get('op') == 'uncomplete':
+        if day in dates:
+            dates.remove(day)
+
+
+def _clone_file(src: str, dst: str):
+    """Copy src over dst, as a copy-on-write clone where the filesystem allows.
+
+    A clone only shares extents, so it is near-instant regardless of size;
+    elsewhere this falls back to shutil.copyfile and its in-kernel copy.
+    """
+    if fcntl is not None and sys.platform.startswith('linux'):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                return
+            except OSError:
+                pass  # Not supported here; copy the bytes instead
+    shutil.copyfile(src, dst)
+
 
 def _resource_path(relative_path: str) -> str:
     """Return absolute path to resource, works for dev and for PyInstaller.
@@ -25,16 +181,29 @@ def _resource_path(relative_path: str) -> str:
     return os.path.join(base_path, relative_path)
 
 
+# Default data shipped next to the app, resolved once; None when not bundled
+_BUNDLED_HABITS_PATH: Optional[str] = _resource_path('habits.json')
+if not os.path.exists(_BUNDLED_HABITS_PATH):
+    _BUNDLED_HABITS_PATH = None
+
+
 class HabitStorage:
     """Handles persistent storage of habit data in JSON format."""
     
-    def __init__(self, filename: str = None):
+    def __init__(self, filename: str = None, sync_mode: SyncMode = SyncMode.NEVER,
+                 compress: bool = False):
         """
         Initialize storage handler.
 
         Args:
             filename: Optional path to JSON file. If None, a writable file is
                 created under the user's app data folder (e.g. ~/.habit_tracker/habits.json).
+            sync_mode: Durability policy for saves; with EVERY_SEC, saves are
+                buffered and written by a background thread at most once a
+                second, on exit, or when flush() is called.
+            compress: Write the data file zstd-compressed when the optional
+                `zstandard` package is installed. Compressed and plain files
+                are both read regardless of this setting.
         """
         # Determine a safe, writable path for persistent data
         if filename:
@@ -43,8 +212,44 @@ class HabitStorage:
             # Default location in the user's home directory
             home = os.path.expanduser('~')
             app_dir = os.path.join(home, '.habit_tracker')
-            os.makedirs(app_dir, exist_ok=True)
             self.filename = os.path.join(app_dir, 'habits.json')
+        # Create the data directory once here rather than on every save
+        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+        self._dir_ready = True
+        # Encoded JSON per habit id, reused by save_habits while unchanged
+        self._fragments: Dict[str, tuple] = {}
+        # (encoded habits array, full document) from the last encode_habits()
+        self._last_encoded: Optional[tuple] = None
+        # Digest of the bytes last read from or written to the file
+        self._last_hash: Optional[bytes] = None
+        # Append-only change log (habits.jsonl) replayed on top of the snapshot.
+        # Positions are absolute byte offsets into everything ever logged;
+        # the file holds the bytes from _log_start to _log_end.
+        self.log_filename = os.path.splitext(self.filename)[0] + '.jsonl'
+        self._log_start = 0
+        self._log_end = (os.path.getsize(self.log_filename)
+                         if os.path.exists(self.log_filename) else 0)
+        # Length of the snapshot's JSON, uncompressed, as last loaded or written
+        self._snapshot_size = 0
+        # Guards in-memory state and the change log file. Snapshot writes
+        # (and their fsync) happen under _io_lock only, so check-ins logged
+        # from the UI thread never wait on them. Take _io_lock first.
+        self._lock = threading.RLock()
+        self._io_lock = threading.RLock()
+        self.sync_mode = sync_mode
+        self._compressor = (zstandard.ZstdCompressor(level=3)
+                            if compress and zstandard is not None else None)
+        # Newest (payload, log position) waiting for the background writer
+        self._pending: Optional[tuple] = None
+        self._log_unsynced = False
+        # Background writer, started on first use and stopped by close()
+        self._wakeup = threading.Condition(self._lock)
+        self._writer: Optional[threading.Thread] = None
+        self._closing = False
+        if sync_mode is SyncMode.EVERY_SEC:
+            atexit.register(self.flush)
+        # (file signature, data) from the last load, reused while files are unchanged
+        self._load_cache: Optional[tuple] = None
         self._ensure_file_exists()
     
     def _ensure_file_exists(self):
@@ -56,56 +261,413 @@ class HabitStorage:
         """
         if not os.path.exists(self.filename):
             # Try to copy the bundled default JSON if present
-            try:
-                bundled_path = _resource_path('habits.json')
-                if os.path.exists(bundled_path):
-                    shutil.copy(bundled_path, self.filename)
+            if _BUNDLED_HABITS_PATH is not None:
+                try:
+                    shutil.copy(_BUNDLED_HABITS_PATH, self.filename)
                     return
-            except Exception:
-                pass
+                except Exception:
+                    pass
 
             # Fall back to creating an empty file
-            self.save_data({"habits": [], "metadata": {"created": datetime.now().isoformat()}})
+            self.save_data(_default_data())
     
     def load_data(self) -> Dict[str, Any]:
         """
-        Load habit data from JSON file.
+        Load habit data from JSON file, with logged changes applied.
+        
+        The result is cached until the data file or change log changes on
+        disk, so callers must treat it as read-only.
         
         Returns:
             Dictionary containing habit data
         """
+        if self._pending is not None:
+            self.flush()
         try:
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with self._lock:
+                signature = self._file_signature()
+                if self._load_cache is not None and self._load_cache[0] == signature:
+                    return self._load_cache[1]
+                with open(self.filename, 'rb') as f:
+                    data = self._parse_snapshot(f)
+                self._replay_log(data)
+                self._load_cache = (signature, data)
+            return data
         except (json.JSONDecodeError, FileNotFoundError) as e:
             print(f"Error loading data: {e}")
             # Return default structure if file is corrupted
-            return {"habits": [], "metadata": {"created": datetime.now().isoformat()}}
+            return _default_data()
+    
+    def _file_signature(self) -> tuple:
+        """Return (mtime_ns, size) of the data file and of the change log."""
+        st = os.stat(self.filename)
+        try:
+            log = os.stat(self.log_filename)
+            log_key = (log.st_mtime_ns, log.st_size)
+        except FileNotFoundError:
+            log_key = None
+        return (st.st_mtime_ns, st.st_size, log_key)
+    
+    def _parse_snapshot(self, f) -> Dict[str, Any]:
+        """Parse the open data file, mapping it instead of reading it when large.
+
+        orjson parses straight out of the mapping, so a big history is never
+        held in memory as both a bytes copy and the parsed result.
+        """
+        size = os.fstat(f.fileno()).st_size
+        if orjson is None or size < _MMAP_THRESHOLD:
+            raw = f.read()
+            if raw.startswith(_ZSTD_MAGIC):
+                raw = _decompress(raw)
+            data = _loads(raw)
+            self._last_hash = _digest(raw)
+            size = len(raw)
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                if mm[:4] == _ZSTD_MAGIC:
+                    raw = _decompress(mm)
+                    data = orjson.loads(raw)
+                    self._last_hash = _digest(raw)
+                    size = len(raw)
+                else:
+                    with memoryview(mm) as view:
+                        data = orjson.loads(view)
+                        self._last_hash = _digest(view)
+        self._snapshot_size = size
+        return data
     
-    def save_data(self, data: Dict[str, Any]):
+    def save_data(self, data: Dict[str, Any], pretty: bool = False):
         """
         Save habit data to JSON file.
         
         Args:
             data: Dictionary containing habit data to save
+            pretty: Indent the JSON for human readers instead of writing it compactly
+        """
+        self._commit(_dumps(data, pretty), self._log_end)
+    
+    def save_habits(self, habits: Iterable[Any], metadata: Dict[str, Any]):
+        """
+        Save habits, re-encoding only those that changed since the last save.
+        
+        Produces the same file as save_data() on the equivalent dictionary.
+        
+        Args:
+            habits: Habit instances in display order
+            metadata: Metadata block to store alongside the habits
+        """
+        self.save_encoded(self.encode_habits(habits, metadata))
+    
+    def encode_habits(self, habits: Iterable[Any], metadata: Dict[str, Any]) -> bytes:
+        """
+        Encode habits to JSON bytes, reusing output for unchanged habits.
+        
+        When the habits encode exactly as last time, the previous document
+        is returned as is, metadata included. Metadata such as a
+        last_updated timestamp then cannot force a rewrite of data that did
+        not change.
+        
+        Args:
+            habits: Habit instances in display order
+            metadata: Metadata block to store alongside the habits
+            
+        Returns:
+            The encoded document, ready for save_encoded()
+        """
+        fragments = {}
+        parts = []
+        for habit in habits:
+            entry = self._fragments.get(habit.id)
+            if entry is None or entry[0] is not habit or entry[1] != habit.version:
+                entry = (habit, habit.version, _encode_habit(habit))
+            fragments[habit.id] = entry
+            parts.append(entry[2])
+        self._fragments = fragments
+        
+        habits_json = b','.join(parts)
+        if self._last_encoded is not None and self._last_encoded[0] == habits_json:
+            return self._last_encoded[1]
+        payload = b'{"habits":[' + habits_json + b'],"metadata":' + _dumps(metadata) + b'}'
+        self._last_encoded = (habits_json, payload)
+        return payload
+    
+    def save_encoded(self, payload: bytes, log_position: Optional[int] = None):
+        """
+        Write an already encoded document to the JSON file.
+        
+        Safe to call from a background thread.
+        
+        Args:
+            payload: UTF-8 JSON bytes from encode_habits()
+            log_position: Value of log_position when the payload was encoded;
+                changes logged after it are kept. Defaults to the current end.
+        """
+        self._commit(payload, self._log_end if log_position is None else log_position)
+    
+    def save_encoded_async(self, payload: bytes):
+        """
+        Hand an encoded document to the background writer and return at once.
+        
+        Only the newest document is kept; one still waiting when a newer one
+        arrives is dropped. With EVERY_SEC it is written within a second,
+        otherwise straight away. Call close() to wait for the write.
+        
+        Args:
+            payload: UTF-8 JSON bytes from encode_habits()
+        """
+        with self._lock:
+            # The log position is taken now: changes logged after encoding are kept
+            self._pending = (payload, self._log_end)
+            self._wake_writer()
+    
+    def close(self):
+        """Stop the background writer and write anything still buffered."""
+        with self._lock:
+            writer = self._writer
+            self._closing = True
+            self._wakeup.notify()
+        if writer is not None:
+            writer.join()
+        with self._lock:
+            self._writer = None
+            self._closing = False
+        self.flush()
+    
+    def _wake_writer(self):
+        """Start the background writer if needed and signal it (holding _lock)."""
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
+        self._wakeup.notify()
+    
+    def _writer_loop(self):
+        """Flush buffered saves and log syncs until close() is called."""
+        delay = 1.0 if self.sync_mode is SyncMode.EVERY_SEC else 0
+        while True:
+            with self._wakeup:
+                self._wakeup.wait_for(lambda: self._closing or self._pending is not None
+                                      or self._log_unsynced)
+                if self._closing:
+                    return  # close() writes what is left
+                if delay:
+                    # Gather further changes for up to a second; close() cuts this short
+                    self._wakeup.wait_for(lambda: self._closing, timeout=delay)
+            try:
+                self.flush()
+            except Exception:
+                # Reported by _write; flush() kept the save, so retry after a pause
+                with self._wakeup:
+                    self._wakeup.wait_for(lambda: self._closing, timeout=1.0)
+    
+    def flush(self):
+        """
+        Write any buffered save and sync the change log (EVERY_SEC mode).
+        
+        If the write fails the buffered save is kept for the next attempt,
+        unless a newer save has replaced it meanwhile.
+        """
+        with self._io_lock:
+            with self._lock:
+                pending, self._pending = self._pending, None
+                sync_log, self._log_unsynced = self._log_unsynced, False
+            try:
+                if pending is not None:
+                    self._write(pending[0])
+                if sync_log and os.path.exists(self.log_filename):
+                    with open(self.log_filename, 'ab') as f:
+                        os.fsync(f.fileno())
+            except Exception:
+                with self._lock:
+                    if self._pending is None:
+                        self._pending = pending
+                    self._log_unsynced = self._log_unsynced or sync_log
+                raise
+            if pending is not None:
+                with self._lock:
+                    self._trim_log(pending[1])
+    
+    def _commit(self, payload: bytes, log_position: int):
+        """Write a full document now, or buffer it in EVERY_SEC mode."""
+        if self.sync_mode is SyncMode.EVERY_SEC:
+            with self._lock:
+                self._pending = (payload, log_position)
+                self._wake_writer()
+            return
+        with self._io_lock:
+            with self._lock:
+                # A document still queued for the writer is older than this one
+                if self._pending is not None and self._pending[1] <= log_position:
+                    self._pending = None
+            self._write(payload)
+            with self._lock:
+                self._trim_log(log_position)
+    
+    @property
+    def log_position(self) -> int:
+        """Position just past the last change appended to the log."""
+        return self._log_end
+    
+    def append_delta(self, event: Dict[str, Any]):
+        """
+        Record a single change without rewriting the whole data file.
+        
+        Args:
+            event: e.g. {"op": "complete", "habit_id": ..., "date": "2025-12-01"};
+                op is "complete" or "uncomplete"
+        """
+        line = _dumps(event) + b'\n'
+        with self._lock:
+            created = not os.path.exists(self.log_filename)
+            with open(self.log_filename, 'ab') as f:
+                f.write(line)
+                if self.sync_mode is SyncMode.PER_COMMIT:
+                    f.flush()
+                    _fsync(f.fileno(), full=True)
+            # A new log file is only durable once its directory entry is
+            if created and self.sync_mode is SyncMode.PER_COMMIT:
+                _fsync_dir(os.path.dirname(self.log_filename))
+            self._log_end += len(line)
+            self._load_cache = None
+            if self.sync_mode is SyncMode.EVERY_SEC:
+                self._log_unsynced = True
+                self._wake_writer()
+    
+    def needs_compaction(self) -> bool:
+        """Return True once the change log outgrows the snapshot it patches."""
+        return self._log_end - self._log_start > 4 * max(self._snapshot_size, 1024)
+    
+    def compact(self):
+        """Fold the change log into the data file and empty the log."""
+        with self._io_lock:
+            with self._lock:
+                data = self.load_data()
+                position = self._log_end
+            self._write(_dumps(data))
+            with self._lock:
+                self._trim_log(position)
+    
+    def _replay_log(self, data: Dict[str, Any]):
+        """Apply the logged changes to freshly loaded data in place."""
+        if self._log_end == self._log_start or not os.path.exists(self.log_filename):
+            return
+        habits_by_id = {h.get('id'): h for h in data.get('habits', [])}
+        with open(self.log_filename, 'rb') as f:
+            for line in f:
+                try:
+                    event = _loads(line)
+                except ValueError:
+                    # A torn final line from an interrupted append
+                    continue
+                if not isinstance(event, dict):
+                    # Valid JSON, but not a change event
+                    continue
+                _apply_delta(habits_by_id, event)
+    
+    def _trim_log(self, position: int):
+        """Drop logged changes up to `position`, now covered by the snapshot."""
+        if position <= self._log_start:
+            return
+        if position >= self._log_end:
+            if os.path.exists(self.log_filename):
+                os.truncate(self.log_filename, 0)
+        else:
+            # Changes were logged while the payload was being written. They
+            # are not in the snapshot, so swap in the shortened log atomically.
+            with open(self.log_filename, 'rb') as f:
+                f.seek(position - self._log_start)
+                tail = f.read()
+            directory = os.path.dirname(self.log_filename)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.habits_', suffix='.jsonl')
+            try:
+                with open(fd, 'wb') as f:
+                    f.write(tail)
+                    if self.sync_mode is not SyncMode.NEVER:
+                        f.flush()
+                        _fsync(f.fileno(), full=self.sync_mode is SyncMode.PER_COMMIT)
+                os.replace(tmp_path, self.log_filename)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+            if self.sync_mode is SyncMode.PER_COMMIT:
+                _fsync_dir(directory)
+        self._log_start = min(position, self._log_end)
+        self._load_cache = None
+    
+    def _write(self, payload: bytes):
+        """Atomically replace the data file with encoded JSON (under _io_lock).
+
+        The payload goes to a temporary file in the same directory which is
+        then renamed over the data file, so a crash mid-write never leaves a
+        truncated habits.json behind. Payloads identical to what is already
+        on disk are skipped.
         """
+        digest = _digest(payload)
+        if digest == self._last_hash and os.path.exists(self.filename):
+            return
+        tmp_path = None
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.filename), exist_ok=True)
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            directory = os.path.dirname(self.filename)
+            if not self._dir_ready:
+                os.makedirs(directory, exist_ok=True)
+                self._dir_ready = True
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.habits_', suffix='.json')
+            with open(fd, 'wb', buffering=1 << 16) as f:
+                if self._compressor is not None:
+                    f.write(self._compressor.compress(payload))
+                else:
+                    f.write(payload)
+                if self.sync_mode is not SyncMode.NEVER:
+                    f.flush()
+                    _fsync(f.fileno(), full=self.sync_mode is SyncMode.PER_COMMIT)
+            os.replace(tmp_path, self.filename)
+            if self.sync_mode is SyncMode.PER_COMMIT:
+                _fsync_dir(directory)
+            with self._lock:
+                self._load_cache = None
+                self._last_hash = digest
+                self._snapshot_size = len(payload)
         except Exception as e:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            if isinstance(e, FileNotFoundError):
+                # The directory was removed; recreate it on the next save
+                self._dir_ready = False
             print(f"Error saving data: {e}")
             raise
     
+    def export_pretty(self, path: str):
+        """
+        Write an indented copy of the current data for people to read.
+        
+        The data file itself stays compact; this is for on-demand exports.
+        
+        Args:
+            path: Destination file, overwritten if it exists
+        """
+        with open(path, 'wb') as f:
+            f.write(_dumps(self.load_data(), pretty=True))
+    
     def backup_data(self):
-        """Create a backup of the current data file."""
-        if os.path.exists(self.filename):
-            backup_filename = f"{self.filename}.backup"
-            try:
-                data = self.load_data()
-                with open(backup_filename, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                print(f"Backup created: {backup_filename}")
-            except Exception as e:
-                print(f"Error creating backup: {e}")
+        """Create a backup of the current data file.
+
+        Buffered saves and logged check-ins are folded into the data file
+        first, so the backup holds everything load_data() would return.
+        """
+        backup_filename = f"{self.filename}.backup"
+        try:
+            with self._io_lock:
+                if self._pending is not None:
+                    self.flush()
+                if self._log_end > self._log_start and os.path.exists(self.filename):
+                    self.compact()
+                # A byte copy (or clone); no need to parse and re-encode the file
+                _clone_file(self.filename, backup_filename)
+                shutil.copystat(self.filename, backup_filename)
+            print(f"Backup created: {backup_filename}")
+        except FileNotFoundError:
+            # Nothing saved yet, so nothing to back up
+            pass
+        except Exception as e:
+            print(f"Error creating backup: {e}")
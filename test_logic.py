@@ -2,60 +2,300 @@
 Test script to verify Habit Tracker logic.
 """
 import os
-import unittest
 from datetime import date, timedelta
+import pytest
 from habit_model import Habit, HabitManager
-from storage import HabitStorage
-
-class TestHabitTracker(unittest.TestCase):
-    def setUp(self):
-        self.test_file = "test_habits.json"
-        self.storage = HabitStorage(self.test_file)
-        self.manager = HabitManager()
-
-    def tearDown(self):
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
-        if os.path.exists(f"{self.test_file}.backup"):
-            os.remove(f"{self.test_file}.backup")
-
-    def test_streak_calculation(self):
-        habit = Habit("Test Habit")
-        
-        # No completions
-        self.assertEqual(habit.get_current_streak(), 0)
-        
-        # Completed today
-        habit.mark_completed(date.today())
-        self.assertEqual(habit.get_current_streak(), 1)
-        
-        # Completed yesterday and today
-        yesterday = date.today() - timedelta(days=1)
-        habit.mark_completed(yesterday)
-        self.assertEqual(habit.get_current_streak(), 2)
-        
-        # Missed a day (gap)
-        three_days_ago = date.today() - timedelta(days=3)
-        habit.mark_completed(three_days_ago)
-        self.assertEqual(habit.get_current_streak(), 2) # Streak is still 2 (today + yesterday)
-
-    def test_persistence(self):
-        # Add habit and save
-        habit = self.manager.add_habit("Reading", "Read 10 pages")
-        habit.mark_completed()
-        
-        data = self.manager.to_dict()
-        self.storage.save_data(data)
-        
-        # Load into new manager
-        new_manager = HabitManager()
-        loaded_data = self.storage.load_data()
-        new_manager.from_dict(loaded_data)
+from storage import HabitStorage, SyncMode
+
+
+@pytest.fixture(scope="module")
+def storage(tmp_path_factory):
+    # One storage handle for the whole module; tests that save rewrite the file
+    return HabitStorage(str(tmp_path_factory.mktemp("data") / "test_habits.json"))
+
+
+@pytest.fixture
+def manager():
+    return HabitManager()
+
+
+def test_streak_calculation():
+    habit = Habit("Test Habit")
+    
+    # No completions
+    assert habit.get_current_streak() == 0
+    
+    # Completed today
+    habit.mark_completed(date.today())
+    assert habit.get_current_streak() == 1
+    
+    # Completed yesterday and today
+    yesterday = date.today() - timedelta(days=1)
+    habit.mark_completed(yesterday)
+    assert habit.get_current_streak() == 2
+    
+    # Missed a day (gap)
+    three_days_ago = date.today() - timedelta(days=3)
+    habit.mark_completed(three_days_ago)
+    assert habit.get_current_streak() == 2 # Streak is still 2 (today + yesterday)
+
+
+def test_longest_streak():
+    habit = Habit("Test Habit")
+    assert habit.get_longest_streak() == 0
+    
+    start = date(2025, 1, 1)
+    for offset in (0, 1, 2, 5, 6):
+        habit.mark_completed(start + timedelta(days=offset))
+    assert habit.get_longest_streak() == 3
+    
+    # Unmarking the middle day splits the run
+    habit.unmark_completed(start + timedelta(days=1))
+    assert habit.get_longest_streak() == 2
+
+
+def test_recent_completions():
+    habit = Habit("Test Habit", created_date="2025-01-05")
+    today = date(2025, 1, 10)
+    habit.mark_completed(date(2025, 1, 4))  # before creation
+    habit.mark_completed(date(2025, 1, 9))
+    habit.mark_completed(today)
+    
+    assert habit.get_recent_completions(7, today) == [True, False, False, False, False, True, True]
+
+
+def test_search_habits(manager):
+    read = manager.add_habit("Read Books")
+    run = manager.add_habit("Running")
+    manager.add_habit("Meditate")
+    
+    assert manager.search_habits("r") == [read, run]
+    assert manager.search_habits("OOK") == [read]
+    assert manager.search_habits("xyz") == []
+    assert manager.search_habits("read book") == [read]
+    assert manager.search_habits("books read") == []
+    
+    manager.update_habit(run.id, name="Jogging")
+    assert manager.search_habits("run") == []
+    assert manager.search_habits("jog") == [run]
+    
+    manager.remove_habit(read.id)
+    assert manager.search_habits("r") == []
+
+
+def test_persistence(storage, manager):
+    # Add habit and save
+    habit = manager.add_habit("Reading", "Read 10 pages")
+    habit.mark_completed()
+    
+    data = manager.to_dict()
+    storage.save_data(data)
+    
+    # Load into new manager
+    new_manager = HabitManager()
+    loaded_data = storage.load_data()
+    new_manager.from_dict(loaded_data)
+    
+    loaded_habits = new_manager.get_all_habits()
+    assert len(loaded_habits) == 1
+    assert loaded_habits[0].name == "Reading"
+    assert loaded_habits[0].is_completed_today()
+
+
+def test_save_habits_matches_save_data(storage, manager):
+    manager.add_habit("Reading", "Read 10 pages")
+    manager.add_habit("Läufen", 'Unicode ✓, "quotes"\tand\nescapes').mark_completed()
+    metadata = {"last_updated": "2025-12-01T19:00:00", "total_habits": 2}
+    
+    storage.save_data({"habits": [h.to_dict() for h in manager.habits],
+                       "metadata": metadata})
+    with open(storage.filename, 'rb') as f:
+        expected = f.read()
+    
+    # Second save reuses the cached fragment of the unchanged habit
+    storage.save_habits(manager.habits, metadata)
+    manager.habits[0].mark_completed()
+    storage.save_habits(manager.habits, metadata)
+    manager.habits[0].unmark_completed()
+    storage.save_habits(manager.habits, metadata)
+    with open(storage.filename, 'rb') as f:
+        assert f.read() == expected
+
+
+def test_unchanged_habits_skip_write(storage, manager):
+    habit = manager.add_habit("Reading")
+    storage.save_encoded(storage.encode_habits(manager.habits, {"last_updated": "1"}))
+    before = os.stat(storage.filename)
+    
+    # Toggling back and forth leaves the habits as they were; a newer
+    # metadata timestamp alone must not rewrite the file
+    habit.mark_completed()
+    habit.unmark_completed()
+    storage.save_encoded(storage.encode_habits(manager.habits, {"last_updated": "2"}))
+    after = os.stat(storage.filename)
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+    
+    habit.mark_completed()
+    storage.save_encoded(storage.encode_habits(manager.habits, {"last_updated": "3"}))
+    assert os.stat(storage.filename).st_ino != before.st_ino
+
+
+def test_change_log_replay_and_compaction(storage, manager):
+    habit = manager.add_habit("Reading")
+    storage.save_data(manager.to_dict())
+    
+    storage.append_delta({"op": "complete", "habit_id": habit.id, "date": "2025-12-01"})
+    storage.append_delta({"op": "complete", "habit_id": habit.id, "date": "2025-12-02"})
+    storage.append_delta({"op": "uncomplete", "habit_id": habit.id, "date": "2025-12-01"})
+    
+    # A fresh storage object sees the snapshot plus the logged changes
+    loaded = HabitStorage(storage.filename).load_data()
+    assert loaded["habits"][0]["completion_dates"] == ["2025-12-02"]
+    
+    # Lines that parse but are not events are skipped
+    with open(storage.log_filename, 'ab') as f:
+        f.write(b'5\n[]\n')
+    loaded = HabitStorage(storage.filename).load_data()
+    assert loaded["habits"][0]["completion_dates"] == ["2025-12-02"]
+    
+    storage.compact()
+    assert os.path.getsize(storage.log_filename) == 0
+    loaded = HabitStorage(storage.filename).load_data()
+    assert loaded["habits"][0]["completion_dates"] == ["2025-12-02"]
+
+
+def test_load_cache_sees_every_change(tmp_path):
+    path = str(tmp_path / "habits.json")
+    store = HabitStorage(path)
+    store.save_data({"habits": [{"id": "a", "completion_dates": []}], "metadata": {}})
+    first = store.load_data()
+    assert store.load_data() is first
+    
+    store.append_delta({"op": "complete", "habit_id": "a", "date": "2025-12-01"})
+    assert store.load_data()["habits"][0]["completion_dates"] == ["2025-12-01"]
+    
+    # A full save trims the log; the reload must come from the new snapshot
+    store.save_data({"habits": [{"id": "a", "completion_dates": ["2025-12-02"]}],
+                     "metadata": {}})
+    assert store.load_data()["habits"][0]["completion_dates"] == ["2025-12-02"]
+    
+    # Edited by something other than this storage object
+    with open(path, 'wb') as f:
+        f.write(b'{"habits":[],"metadata":{"edited":true}}')
+    assert store.load_data() == {"habits": [], "metadata": {"edited": True}}
+
+
+def test_sync_save_replaces_queued_async_save(tmp_path):
+    path = str(tmp_path / "habits.json")
+    store = HabitStorage(path)
+    try:
+        store.save_encoded_async(b'{"habits":[],"metadata":{"v":1}}')
+        store.save_data({"habits": [], "metadata": {"v": 2}})
+    finally:
+        store.close()
+    assert HabitStorage(path).load_data()["metadata"] == {"v": 2}
+
+
+def test_every_sec_flush_keeps_later_changes(tmp_path):
+    path = str(tmp_path / "habits.json")
+    buffered = HabitStorage(path, sync_mode=SyncMode.EVERY_SEC)
+    try:
+        doc = {"habits": [{"id": "a", "name": "Buffered", "completion_dates": []}],
+               "metadata": {}}
+        # Holding the snapshot lock keeps the writer thread from flushing first
+        with buffered._io_lock:
+            buffered.save_data(doc)
+            # Logged after the buffered save was taken, so not part of it
+            buffered.append_delta({"op": "complete", "habit_id": "a", "date": "2025-12-01"})
+            with open(path, 'rb') as f:
+                assert b'"Buffered"' not in f.read()
+            
+            buffered.flush()
+        with open(path, 'rb') as f:
+            assert b'"Buffered"' in f.read()
+        assert os.path.getsize(buffered.log_filename) > 0
+        loaded = HabitStorage(path).load_data()
+        assert loaded["habits"][0]["completion_dates"] == ["2025-12-01"]
+    finally:
+        buffered.close()
+
+
+def test_failed_flush_keeps_buffered_save(tmp_path, monkeypatch):
+    path = str(tmp_path / "habits.json")
+    buffered = HabitStorage(path, sync_mode=SyncMode.EVERY_SEC)
+    try:
+        # Hold the snapshot lock so only this thread's flush sees the failure
+        with buffered._io_lock:
+            buffered.save_data({"habits": [], "metadata": {"v": 1}})
+            
+            def disk_full(payload):
+                raise OSError("disk full")
+            monkeypatch.setattr(buffered, "_write", disk_full)
+            with pytest.raises(OSError):
+                buffered.flush()
+            monkeypatch.undo()
         
-        loaded_habits = new_manager.get_all_habits()
-        self.assertEqual(len(loaded_habits), 1)
-        self.assertEqual(loaded_habits[0].name, "Reading")
-        self.assertTrue(loaded_habits[0].is_completed_today())
+        buffered.flush()
+        assert HabitStorage(path).load_data()["metadata"] == {"v": 1}
+    finally:
+        buffered.close()
+
+
+def test_compressed_round_trip(tmp_path):
+    pytest.importorskip('zstandard')
+    path = str(tmp_path / "habits.json")
+    doc = {"habits": [{"id": "a", "name": "Läufen",
+                       "completion_dates": ["2025-12-01", "2025-12-02"]}],
+           "metadata": {}}
+    compressed = HabitStorage(path, compress=True)
+    compressed.save_data(doc)
+    with open(path, 'rb') as f:
+        assert f.read(4) == b'\x28\xb5\x2f\xfd'
+    
+    # Compression is detected on load, whatever the reader's own setting
+    plain = HabitStorage(path)
+    assert plain.load_data() == doc
+    assert plain._snapshot_size == compressed._snapshot_size
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_mmap_load_matches_read(tmp_path, monkeypatch, compress):
+    pytest.importorskip('orjson')
+    if compress:
+        pytest.importorskip('zstandard')
+    path = str(tmp_path / "habits.json")
+    doc = {"habits": [{"id": "a", "name": "Läufen",
+                       "completion_dates": ["2025-12-01", "2025-12-02"]}],
+           "metadata": {}}
+    HabitStorage(path, compress=compress).save_data(doc)
+    read = HabitStorage(path)
+    assert read.load_data() == doc
+    
+    # Any file at least this large is parsed from a memory map
+    monkeypatch.setattr("storage._MMAP_THRESHOLD", 1)
+    mapped = HabitStorage(path)
+    assert mapped.load_data() == doc
+    assert mapped._snapshot_size == read._snapshot_size
+
 
-if __name__ == '__main__':
-    unittest.main()
+def test_backup_copies_bytes(tmp_path):
+    path = str(tmp_path / "habits.json")
+    store = HabitStorage(path)
+    store.save_data({"habits": [], "metadata": {"note": "Läufen ✓"}})
+    store.backup_data()
+    with open(path, 'rb') as original, open(f"{path}.backup", 'rb') as backup:
+        assert backup.read() == original.read()
+    assert os.stat(f"{path}.backup").st_mtime_ns == os.stat(path).st_mtime_ns
+    
+    # Check-ins still only in the change log belong in the backup too
+    store.save_data({"habits": [{"id": "a", "completion_dates": []}], "metadata": {}})
+    store.append_delta({"op": "complete", "habit_id": "a", "date": "2025-12-01"})
+    store.backup_data()
+    restored = HabitStorage(f"{path}.backup").load_data()
+    assert restored["habits"][0]["completion_dates"] == ["2025-12-01"]
+    
+    # No data file: nothing to back up, and no error
+    os.remove(path)
+    os.remove(f"{path}.backup")
+    store.backup_data()
+    assert not os.path.exists(f"{path}.backup")